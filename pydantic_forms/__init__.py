@@ -1,8 +1,10 @@
 import datetime
+import sys
 import typing as t
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
-from functools import cache, cached_property
+from functools import cache
 
 from pydantic import BaseModel, Field, types
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
@@ -14,6 +16,16 @@ ConfigType = t.Type["BaseConfig"]
 DataType = dict[str, t.Any]
 ErrorType = dict[str, list[PydanticValueError]]
 
+# HTML attribute names recur as dict keys on every widget render; interning
+# them up front keeps those lookups pointer comparisons and deduplicates the
+# strings across renders.
+for _attr in (
+    "name", "id", "type", "value", "class", "required", "checked", "autofocus",
+    "autocomplete", "placeholder", "list", "min", "max", "step", "format",
+):
+    sys.intern(_attr)
+del _attr
+
 
 @t._LiteralSpecialForm
 @t._tp_cache(typed=True)
@@ -28,7 +40,8 @@ class BaseConfig:
     model: t.Type[BaseModel]
 
 
-def inherit_config(self_config: ConfigType, parent_config: ConfigType):
+@cache
+def inherit_config(self_config: ConfigType, parent_config: ConfigType) -> ConfigType:
     if self_config == parent_config:
         base_classes: tuple[ConfigType, ...] = (self_config,)
     else:
@@ -38,21 +51,50 @@ def inherit_config(self_config: ConfigType, parent_config: ConfigType):
 
 
 class FormMetaclass(type):
-    def __new__(cls, name, bases, namespace):
+    def __new__(
+        cls, name: str, bases: tuple[type, ...], namespace: dict[str, t.Any]
+    ) -> "FormMetaclass":
         config = BaseConfig
 
         for base in reversed(bases):
-            if (
-                _is_base_form_class_defined
-                and issubclass(base, BaseForm)
-                and base != BaseForm
-            ):
+            if getattr(base, "__is_form__", False):
                 config = inherit_config(base.__config__, config)
 
         if config_from_namespace := namespace.pop("Config", None):
             config = inherit_config(config_from_namespace, config)
 
         namespace["__config__"] = config
+        # BaseForm itself is created while the flag is still False, so later
+        # subclasses skip it without the old issubclass/equality checks.
+        namespace["__is_form__"] = _is_base_form_class_defined
+
+        if (model := getattr(config, "model", None)) is not None:
+            config.__field_defaults__ = {
+                field_name: field.default
+                for field_name, field in model.__fields__.items()
+            }
+            widget_kwargs = getattr(config, "widget_kwargs", {})
+            # Fields whose type_ is not a plain class (unions, literals, Any)
+            # cannot go through the issubclass dispatch; they are resolved
+            # lazily on first render instead, like on the old per-render path,
+            # so merely defining and validating such a form keeps working.
+            config.__static_widget_kwargs__ = {
+                field_name: {
+                    **_resolve_widget_class(config, field).additional_kwargs(field),
+                    **widget_kwargs.get(field_name, {}),
+                }
+                for field_name, field in model.__fields__.items()
+                if field_name in getattr(config, "widget_classes", {})
+                or isinstance(field.type_, type)
+            }
+            prefix = getattr(config, "prefix", "")
+            config.__prefixed_names__ = {
+                field_name: (
+                    sys.intern(f"{prefix}{field_name}"),
+                    sys.intern(f"id_{prefix}{field_name}"),
+                )
+                for field_name in model.__fields__
+            }
 
         return super().__new__(cls, name, bases, namespace)
 
@@ -78,7 +120,8 @@ class BaseForm(metaclass=FormMetaclass):
             )
 
         self._initial = initial
-        self._model_data = self.get_model_data()
+        self._initial_data: DataType | None = None
+        self._model_data: DataType | None = None
 
     @property
     def data(self) -> BaseModel:
@@ -94,15 +137,13 @@ class BaseForm(metaclass=FormMetaclass):
         else:
             return None
 
-        errors: ErrorType = {}
+        errors: ErrorType = defaultdict(list)
         error = t.cast(ValidationError, self._error)
         for exc in error.raw_errors:
-            assert isinstance(exc, ErrorWrapper)
-            assert isinstance(exc.exc, PydanticValueError)
-            (field,) = exc.loc_tuple()
-            errors.setdefault(t.cast(str, field), []).append(exc.exc)
+            exc = t.cast(ErrorWrapper, exc)
+            errors[t.cast(str, exc.loc_tuple()[0])].append(exc.exc)
 
-        return errors
+        return dict(errors)
 
     def clean(self) -> None:
         if self._error is not None:
@@ -116,11 +157,16 @@ class BaseForm(metaclass=FormMetaclass):
         data = self.process_data(self.get_model_data())
         model_class = self.get_model_class()
 
-        try:
-            self._model = model_class(**data)
-        except ValidationError as ex:
-            self._error = ex
-            raise
+        if self._data is None and self._initial is not None:
+            # The initial data comes from an already-validated model
+            # instance, so validating it again would be wasted work.
+            self._model = model_class.construct(**data)
+        else:
+            try:
+                self._model = model_class(**data)
+            except ValidationError as ex:
+                self._error = ex
+                raise
 
         self._model_data = self.get_model_data()
 
@@ -142,7 +188,9 @@ class BaseForm(metaclass=FormMetaclass):
         data = {}
 
         if self._initial:
-            data.update(self._initial.dict())
+            if self._initial_data is None:
+                self._initial_data = self._initial.dict()
+            data.update(self._initial_data)
 
         if self._data is not None:
             data.update(self._data)
@@ -153,24 +201,32 @@ class BaseForm(metaclass=FormMetaclass):
         return data
 
     def value_of(self, field: str) -> t.Any:
-        return self._model_data.get(
-            field, self.__config__.model.__fields__[field].default
-        )
+        if self._model_data is None:
+            self._model_data = self.get_model_data()
+
+        return self._model_data.get(field, self.__config__.__field_defaults__[field])
 
 
 _is_base_form_class_defined = True
 
 
 class WidgetMetaclass(ModelMetaclass):
-    def __new__(cls, name, bases, namespace):
-        exclude_attrs: set[str] = set()
-
-        for base in reversed(bases):
-            exclude_attrs.update(getattr(base, "__exclude_attrs__", []))
-
-        exclude_attrs.update(namespace.get("__exclude_attrs__", []))
+    def __new__(
+        cls, name: str, bases: tuple[type, ...], namespace: dict[str, t.Any]
+    ) -> "WidgetMetaclass":
+        exclude_attrs = frozenset().union(
+            *(getattr(base, "__exclude_attrs__", ()) for base in bases),
+            namespace.get("__exclude_attrs__", ()),
+        )
         namespace["__exclude_attrs__"] = exclude_attrs
-        return super().__new__(cls, name, bases, namespace)
+
+        widget_class = super().__new__(cls, name, bases, namespace)
+        widget_class.__attr_fields__ = tuple(
+            field_name
+            for field_name in widget_class.__fields__
+            if field_name not in exclude_attrs
+        )
+        return widget_class
 
 
 class Widget(BaseModel, metaclass=WidgetMetaclass):
@@ -196,14 +252,10 @@ class Widget(BaseModel, metaclass=WidgetMetaclass):
         return str(value)
 
     def attrs(self) -> dict[str, str | bool | None]:
-        return {
-            **{
-                key: value
-                for key, value in self.dict().items()
-                if key not in self.__exclude_attrs__
-            },
-            **{"class": self.class_, "value": self.format_value(self.value)},
-        }
+        attrs = {key: self.__dict__[key] for key in self.__attr_fields__}
+        attrs["class"] = self.class_
+        attrs["value"] = self.format_value(self.value)
+        return attrs
 
 
 class Input(Widget):
@@ -234,7 +286,7 @@ class Number(Input):
     step: str | None = None
 
     @classmethod
-    def additional_kwargs(self, field: ModelField) -> dict[str, str | bool | None]:
+    def additional_kwargs(cls, field: ModelField) -> dict[str, str | bool | None]:
         kwargs = super().additional_kwargs(field)
 
         if (ge := getattr(field.type_, "ge", None)) is not None:
@@ -245,6 +297,18 @@ class Number(Input):
         return kwargs
 
 
+# strftime re-parses its format spec on every call; the common ISO patterns
+# used by the date/time widgets are formatted directly instead.
+_FAST_STRFTIME: dict[str, t.Callable[[t.Any], str]] = {
+    "%Y-%m-%d": lambda v: f"{v.year:04d}-{v.month:02d}-{v.day:02d}",
+    "%H:%M:%S": lambda v: f"{v.hour:02d}:{v.minute:02d}:{v.second:02d}",
+    "%Y-%m-%dT%H:%M:%S": lambda v: (
+        f"{v.year:04d}-{v.month:02d}-{v.day:02d}"
+        f"T{v.hour:02d}:{v.minute:02d}:{v.second:02d}"
+    ),
+}
+
+
 class StrftimeMixin(BaseModel):
 
     format: str
@@ -254,8 +318,10 @@ class StrftimeMixin(BaseModel):
         if value is None:
             return ""
 
-        return self.value.strftime(format)
+        if (fast := _FAST_STRFTIME.get(self.format)) is not None:
+            return fast(value)
 
+        return value.strftime(self.format)
 
 
 class Date(StrftimeMixin, Input):
@@ -274,7 +340,7 @@ class Time(StrftimeMixin, Input):
 class DateTime(StrftimeMixin, Input):
 
     type: str = "date"
-    format: str = "%Y-%m-%dT%H{%M:%S"
+    format: str = "%Y-%m-%dT%H:%M:%S"
 
 
 class Checkbox(Input):
@@ -294,13 +360,37 @@ class BaseRenderer:
         raise NotImplementedError()
 
 
+def _compile_attr_renderer(keys: tuple[str, ...]) -> t.Callable[[dict[str, t.Any]], str]:
+    # Unroll the attribute loop into a compiled function so rendering a
+    # widget is straight-line bytecode without per-key dispatch.
+    lines = ["def render(attrs):", "    parts = []", "    append = parts.append"]
+
+    for key in keys:
+        lines.append(f"    value = attrs[{key!r}]")
+        lines.append("    if value is True:")
+        lines.append(f"        append({key!r})")
+        lines.append("    elif value is not None and value is not False:")
+        lines.append(f"        append(f'{key}=\"{{value}}\"')")
+
+    lines.append("    return ' '.join(parts)")
+
+    namespace: dict[str, t.Any] = {}
+    exec(compile("\n".join(lines), "<render_attrs>", "exec"), namespace)
+    return namespace["render"]
+
+
+_attr_renderers: dict[tuple[str, ...], t.Callable[[dict[str, t.Any]], str]] = {}
+
+
 class StringRenderer(BaseRenderer):
     def render_attrs(self, widget: "Widget") -> str:
-        return " ".join(
-            f"{key}" if value is True else f'{key}="{value}"'
-            for key, value in widget.attrs().items()
-            if value is not None and value is not False
-        )
+        attrs = widget.attrs()
+        keys = tuple(attrs)
+
+        if (render := _attr_renderers.get(keys)) is None:
+            render = _attr_renderers[keys] = _compile_attr_renderer(keys)
+
+        return render(attrs)
 
     def render_widget(self, widget: "Widget") -> str:
         attrs = self.render_attrs(widget)
@@ -309,10 +399,85 @@ class StringRenderer(BaseRenderer):
         return f"<{tag} {attrs}>"
 
 
+_TYPE_WIDGET_MAP: dict[type, t.Type[Widget]] = {
+    bool: Checkbox,
+    int: Number,
+    float: Number,
+    datetime.date: Date,
+    datetime.time: Time,
+    datetime.datetime: DateTime,
+}
+
+
+@cache
+def _widget_class_for_type(type_: type) -> t.Type[Widget]:
+    if issubclass(type_, bool):
+        return Checkbox
+    elif issubclass(type_, (int, float)):
+        return Number
+    elif issubclass(type_, types.SecretStr):
+        return Password
+
+    return Input
+
+
+def _resolve_widget_class(config: ConfigType, field: ModelField) -> t.Type[Widget]:
+    return (
+        getattr(config, "widget_classes", {}).get(field.name)
+        or _TYPE_WIDGET_MAP.get(field.type_)
+        or _widget_class_for_type(field.type_)
+    )
+
+
+class Jinja2Renderer(BaseRenderer):
+    """Renders widgets through compiled Jinja templates.
+
+    Optional alternative to StringRenderer, requires jinja2. A template is
+    compiled per attribute shape on first use; after that every render is a
+    single call into Jinja's compiled code path.
+    """
+
+    def __init__(self) -> None:
+        import jinja2
+
+        self._environment = jinja2.Environment(autoescape=False)
+        self._template_cache: dict[tuple[str, ...], jinja2.Template] = {}
+
+    def render_widget(self, widget: "Widget") -> str:
+        attrs = widget.attrs()
+        keys = tuple(attrs)
+
+        if (template := self._template_cache.get(keys)) is None:
+            template = self._template_cache[keys] = self._environment.from_string(
+                self._template_source(keys)
+            )
+
+        return template.render(attrs=attrs)
+
+    @staticmethod
+    def _template_source(keys: tuple[str, ...]) -> str:
+        parts = ["<input"]
+
+        for key in keys:
+            parts.append(
+                f"{{% if attrs[{key!r}] is true %}} {key}"
+                f"{{% elif attrs[{key!r}] is not none and attrs[{key!r}] is not false %}}"
+                f' {key}="{{{{ attrs[{key!r}] }}}}"'
+                "{% endif %}"
+            )
+
+        parts.append(">")
+        return "".join(parts)
+
+
 class BoundField:
+
+    __slots__ = ("field", "form", "_widget")
+
     def __init__(self, field: ModelField, form: "Form") -> None:
         self.field = field
         self.form = form
+        self._widget: Widget | None = None
 
     @property
     def required(self) -> bool:
@@ -322,45 +487,36 @@ class BoundField:
     def value(self) -> t.Any:
         return self.form.value_of(self.field.name)
 
-    @cached_property
+    @property
     def widget(self) -> Widget:
-        widget_class = self.widget_class()
-        kwargs = self.widget_kwargs(widget_class)
-        return widget_class(**kwargs)
+        return self._widget or self._build_widget()
+
+    def _build_widget(self) -> Widget:
+        self._widget = self.widget_class()(**self.widget_kwargs())
+        return self._widget
 
     def widget_class(self) -> t.Type[Widget]:
-        if self.field.name in self.form.__config__.widget_classes:
-            return self.form.__config__.widget_classes[self.field.name]
-
-        if issubclass(self.field.type_, bool):
-            return Checkbox
-        elif issubclass(self.field.type_, (int, float)):
-            return Number
-        elif self.field.type_ == datetime.date:
-            return Date
-        elif self.field.type_ == datetime.time:
-            return Time
-        elif self.field.type_ == datetime.datetime:
-            return DateTime
-        elif issubclass(self.field.type_, types.SecretStr):
-            return Password
-
-        return Input
-
-    def widget_kwargs(
-        self, widget_class: t.Type[Widget]
-    ) -> dict[str, str | bool | None]:
-        name = self.form.prefix_name(self.field.name)
-
-        kwargs: dict[str, str | bool | None] = {
+        return _resolve_widget_class(self.form.__config__, self.field)
+
+    def widget_kwargs(self) -> dict[str, str | bool | None]:
+        config = self.form.__config__
+        name, id_ = config.__prefixed_names__[self.field.name]
+
+        static_kwargs = config.__static_widget_kwargs__.get(self.field.name)
+        if static_kwargs is None:
+            # Deferred for fields the metaclass could not dispatch on type.
+            static_kwargs = config.__static_widget_kwargs__[self.field.name] = {
+                **self.widget_class().additional_kwargs(self.field),
+                **config.widget_kwargs.get(self.field.name, {}),
+            }
+
+        return {
             "name": name,
-            "id": f"id_{name}",
+            "id": id_,
             "required": self.required,
             "value": self.value,
+            **static_kwargs,
         }
-        kwargs.update(widget_class.additional_kwargs(self.field))
-        kwargs.update(self.form.__config__.widget_kwargs.get(self.field.name, {}))
-        return kwargs
 
     def render_widget(self) -> str:
         return self.form.__config__.renderer.render_widget(self.widget)
@@ -370,18 +526,29 @@ class BoundField:
 
 
 class Form(BaseForm):
-    @cache
+
+    _bound_fields: dict[str, BoundField] | None = None
+
+    def clean(self) -> None:
+        super().clean()
+
+        if self._bound_fields is None:
+            self._bound_fields = {
+                name: BoundField(field, self)
+                for name, field in self.__config__.model.__fields__.items()
+            }
+
     def bind_field(self, name: str) -> BoundField:
         self.clean()
-
-        field = self.__config__.model.__fields__[name]
-        return BoundField(field, self)
+        return t.cast(dict[str, BoundField], self._bound_fields)[name]
 
     def prefix_name(self, name: str) -> str:
         return f"{self.__config__.prefix}{name}"
 
     def __getitem__(self, name: str) -> BoundField:
-        return self.bind_field(name)
+        if self._bound_fields is None:
+            self.clean()
+        return t.cast(dict[str, BoundField], self._bound_fields)[name]
 
     class Config(BaseConfig):
         prefix = ""